@@ -14,9 +14,23 @@ Controles:
 """
 
 import pygame
+import json
 import math
+import os
 import sys
 
+# Numba es opcional: sin él, el kernel de búsqueda corre como Python normal
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Constantes del juego
 WIN_COMBINATIONS = [
     (0,1,2), (3,4,5), (6,7,8),  # filas
@@ -24,6 +38,44 @@ WIN_COMBINATIONS = [
     (0,4,8), (2,4,6)            # diagonales
 ]
 
+# El tablero se representa con dos bitboards de 9 bits (uno para X y otro para O):
+# el bit i está encendido si ese jugador ocupa la casilla i
+WIN_MASKS = tuple(sum(1 << i for i in combo) for combo in WIN_COMBINATIONS)
+FULL_BOARD = 0x1FF
+
+# WIN_TABLE[bits] vale 1 si el bitboard bits contiene tres en línea
+WIN_TABLE = bytearray(any((b & m) == m for m in WIN_MASKS) for b in range(FULL_BOARD + 1))
+# Copia como arreglo de numpy para que Numba la capture como constante
+WIN_ARRAY = np.frombuffer(WIN_TABLE, dtype=np.uint8).copy() if np is not None else WIN_TABLE
+
+# Simetrías del tablero (grupo D4): la casilla j de la imagen toma el contenido
+# de la casilla SYMS[k][j] del tablero original
+SYMS = [
+    (0,1,2,3,4,5,6,7,8),  # identidad
+    (6,3,0,7,4,1,8,5,2),  # rotación 90°
+    (8,7,6,5,4,3,2,1,0),  # rotación 180°
+    (2,5,8,1,4,7,0,3,6),  # rotación 270°
+    (2,1,0,5,4,3,8,7,6),  # reflejo horizontal
+    (6,7,8,3,4,5,0,1,2),  # reflejo vertical
+    (0,3,6,1,4,7,2,5,8),  # reflejo en la diagonal principal
+    (8,5,2,7,4,1,6,3,0),  # reflejo en la diagonal secundaria
+]
+# SYM_TABLES[k][bits] es el bitboard bits transformado por la simetría k
+SYM_TABLES = [
+    [sum(((b >> p[j]) & 1) << j for j in range(9)) for b in range(FULL_BOARD + 1)]
+    for p in SYMS
+]
+
+# Cota mayor que cualquier score posible (|score| <= 10), entera para el kernel
+SCORE_INF = 100
+
+# Orden de exploración: centro, esquinas y luego bordes (maximiza las podas)
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+# MOVES_TABLE[x | o] son las casillas libres en ese orden, precalculadas como
+# tuplas para no construir una lista nueva en cada nodo
+MOVES_TABLE = [tuple(i for i in MOVE_ORDER if not (occupied >> i) & 1)
+               for occupied in range(FULL_BOARD + 1)]
+
 # Constantes de Pygame
 WINDOW_SIZE = 600
 GRID_SIZE = 3
@@ -34,6 +86,17 @@ CIRCLE_WIDTH = 15
 CROSS_WIDTH = 25
 SPACE = CELL_SIZE // 4
 
+# Esquina superior izquierda de cada casilla, indexada igual que el tablero
+CELL_POSITIONS = [(col * CELL_SIZE, row * CELL_SIZE)
+                  for row in range(GRID_SIZE) for col in range(GRID_SIZE)]
+
+# Botones (compartidos entre el dibujo y el manejo de clicks)
+BUTTONS = {
+    'x': pygame.Rect(150, 280, 120, 120),
+    'o': pygame.Rect(330, 280, 120, 120),
+    'new_game': pygame.Rect(150, 400, 300, 60),
+}
+
 # Colores
 BG_COLOR = (28, 170, 156)
 LINE_COLOR = (23, 145, 135)
@@ -46,111 +109,236 @@ BUTTON_HOVER = (150, 150, 255)
 # Variables globales para visualización
 PRINT_TREE = True  # Activar/desactivar impresión del árbol
 
-def print_board_state(board, depth, prefix=""):
+# Tabla de transposición: tablero canónico -> (score, tipo de cota)
+# El turno no forma parte de la clave porque lo determina el tablero.
+# Se reinicia en cada llamada a best_move: como la profundidad se mide desde la
+# raíz de esa búsqueda, un mismo tablero siempre aparece a la misma profundidad
+# y los scores 10-depth son válidos para toda la búsqueda.
+TT = {}
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+# Tabla precalculada (generada con precompute.py): tablero + turno -> movimiento
+LUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'minimax.json')
+LUT = None
+
+def load_lut(path=LUT_PATH):
+    """Carga la tabla de movimientos precalculados; si no existe se usa la búsqueda"""
+    global LUT
+    try:
+        with open(path, encoding='utf-8') as f:
+            LUT = json.load(f)
+    except FileNotFoundError:
+        LUT = None
+    return LUT
+
+def cell(x, o, i):
+    """Devuelve el contenido ('X', 'O' o ' ') de la casilla i"""
+    if (x >> i) & 1:
+        return 'X'
+    if (o >> i) & 1:
+        return 'O'
+    return ' '
+
+def board_str(x, o):
+    """Convierte los bitboards en la cadena de 9 caracteres del tablero"""
+    return ''.join(cell(x, o, i) for i in range(9))
+
+def place(x, o, i, player):
+    """Devuelve los bitboards tras colocar player en la casilla i"""
+    if player == 'X':
+        return x | (1 << i), o
+    return x, o | (1 << i)
+
+def print_board_state(x, o, depth, prefix=""):
     """Imprime el estado del tablero con formato ASCII para visualización"""
     if not PRINT_TREE:
         return
+    board = board_str(x, o)
     print(f"{prefix}Tablero (depth={depth}):")
     for i in range(3):
         row = board[i*3:(i+1)*3]
         print(f"{prefix}  {' | '.join([c if c != ' ' else '·' for c in row])}")
 
-def available_moves(board):
-    return [i for i, c in enumerate(board) if c == ' ']
+def canonical(x, o):
+    """Clave del tablero común a sus 8 imágenes simétricas (la menor de ellas)"""
+    return min((t[x] << 9) | t[o] for t in SYM_TABLES)
 
-def check_winner(board):
-    for a, b, c in WIN_COMBINATIONS:
-        if board[a] == board[b] == board[c] and board[a] != ' ':
-            return board[a]
-    if ' ' not in board:
+def available_moves(x, o):
+    return MOVES_TABLE[x | o]
+
+def check_winner(x, o):
+    if WIN_TABLE[x]:
+        return 'X'
+    if WIN_TABLE[o]:
+        return 'O'
+    if (x | o) == FULL_BOARD:
         return 'Tie'
     return None
 
-def minimax(board, depth, is_maximizing, ai_player, hu_player, alpha=-math.inf, beta=math.inf, print_tree=False):
+def _minimax_verbose(ai_bits, hu_bits, depth, is_maximizing, ai_player, hu_player, alpha, beta):
     """
-    Algoritmo Minimax con poda Alpha-Beta y visualización del árbol de estados
+    Algoritmo Minimax con poda Alpha-Beta y visualización del árbol de estados.
+    Solo se usa cuando se imprime el árbol; la búsqueda normal es _minimax_fast.
     """
     indent = "  " * depth
-    winner = check_winner(board)
     
-    if winner == ai_player:
+    if WIN_TABLE[ai_bits]:
         score = 10 - depth
-        if print_tree:
-            print(f"{indent}├─ Nodo terminal: IA gana, score={score}")
+        print(f"{indent}├─ Nodo terminal: IA gana, score={score}")
         return score
-    elif winner == hu_player:
+    elif WIN_TABLE[hu_bits]:
         score = depth - 10
-        if print_tree:
-            print(f"{indent}├─ Nodo terminal: Humano gana, score={score}")
+        print(f"{indent}├─ Nodo terminal: Humano gana, score={score}")
         return score
-    elif winner == 'Tie':
-        if print_tree:
-            print(f"{indent}├─ Nodo terminal: Empate, score=0")
+    elif (ai_bits | hu_bits) == FULL_BOARD:
+        print(f"{indent}├─ Nodo terminal: Empate, score=0")
         return 0
 
-    moves = available_moves(board)
+    key = canonical(ai_bits, hu_bits)
+    entry = TT.get(key)
+    if entry is not None:
+        value, flag = entry
+        if (flag == TT_EXACT or (flag == TT_LOWER and value >= beta)
+                or (flag == TT_UPPER and value <= alpha)):
+            print(f"{indent}├─ Transposición: score={value}")
+            return value
+    alpha_orig, beta_orig = alpha, beta
+
+    moves = available_moves(ai_bits, hu_bits)
     
     if is_maximizing:
         best_score = -math.inf
-        if print_tree:
-            print(f"{indent}├─ Nodo MAX (IA={ai_player}) depth={depth}, {len(moves)} movimientos")
+        print(f"{indent}├─ Nodo MAX (IA={ai_player}) depth={depth}, {len(moves)} movimientos")
         
         for i, move in enumerate(moves):
-            board[move] = ai_player
-            if print_tree:
-                print(f"{indent}│  ├─ Probando movimiento {move+1}:")
-            score = minimax(board, depth+1, False, ai_player, hu_player, alpha, beta, print_tree)
-            board[move] = ' '
+            print(f"{indent}│  ├─ Probando movimiento {move+1}:")
+            score = _minimax_verbose(ai_bits | (1 << move), hu_bits, depth+1, False, ai_player, hu_player, alpha, beta)
             
-            if print_tree:
-                print(f"{indent}│  │  └─ Score recibido: {score}")
+            print(f"{indent}│  │  └─ Score recibido: {score}")
             
             if score > best_score:
                 best_score = score
             alpha = max(alpha, best_score)
             
             if beta <= alpha:
-                if print_tree:
-                    print(f"{indent}│  │  └─ Poda Beta (β={beta} ≤ α={alpha})")
+                print(f"{indent}│  │  └─ Poda Beta (β={beta} ≤ α={alpha})")
                 break
         
-        if print_tree:
-            print(f"{indent}│  └─ Mejor score MAX: {best_score}")
-        return best_score
+        print(f"{indent}│  └─ Mejor score MAX: {best_score}")
     else:
         best_score = math.inf
-        if print_tree:
-            print(f"{indent}├─ Nodo MIN (Humano={hu_player}) depth={depth}, {len(moves)} movimientos")
+        print(f"{indent}├─ Nodo MIN (Humano={hu_player}) depth={depth}, {len(moves)} movimientos")
         
         for i, move in enumerate(moves):
-            board[move] = hu_player
-            if print_tree:
-                print(f"{indent}│  ├─ Probando movimiento {move+1}:")
-            score = minimax(board, depth+1, True, ai_player, hu_player, alpha, beta, print_tree)
-            board[move] = ' '
+            print(f"{indent}│  ├─ Probando movimiento {move+1}:")
+            score = _minimax_verbose(ai_bits, hu_bits | (1 << move), depth+1, True, ai_player, hu_player, alpha, beta)
             
-            if print_tree:
-                print(f"{indent}│  │  └─ Score recibido: {score}")
+            print(f"{indent}│  │  └─ Score recibido: {score}")
             
             if score < best_score:
                 best_score = score
             beta = min(beta, best_score)
             
             if beta <= alpha:
-                if print_tree:
-                    print(f"{indent}│  │  └─ Poda Alpha (β={beta} ≤ α={alpha})")
+                print(f"{indent}│  │  └─ Poda Alpha (β={beta} ≤ α={alpha})")
                 break
         
-        if print_tree:
-            print(f"{indent}│  └─ Mejor score MIN: {best_score}")
-        return best_score
+        print(f"{indent}│  └─ Mejor score MIN: {best_score}")
 
-def best_move(board, ai_player, hu_player):
+    # Con poda el score puede ser solo una cota; se guarda su tipo
+    if best_score <= alpha_orig:
+        TT[key] = (best_score, TT_UPPER)
+    elif best_score >= beta_orig:
+        TT[key] = (best_score, TT_LOWER)
+    else:
+        TT[key] = (best_score, TT_EXACT)
+    return best_score
+
+@njit(cache=True)
+def _minimax_fast(ai_bits, hu_bits, depth, is_maximizing, alpha, beta):
+    """
+    Minimax con poda Alpha-Beta sobre bitboards, sin impresión ni tabla de
+    transposición; compilado con Numba cuando está disponible.
+    
+    Es iterativo: el nodo actual vive en variables locales y al descender a un
+    hijo se apila el marco del padre (bitboards, ventana, siguiente movimiento
+    y mejor score) en lugar de hacer una llamada recursiva.
+    """
+    if WIN_ARRAY[ai_bits]:
+        return 10 - depth
+    if WIN_ARRAY[hu_bits]:
+        return depth - 10
+    if (ai_bits | hu_bits) == FULL_BOARD:
+        return 0
+    
+    stack = []
+    a = ai_bits
+    h = hu_bits
+    is_max = is_maximizing
+    i = 0  # Siguiente índice de MOVE_ORDER a probar
+    best = -SCORE_INF if is_max else SCORE_INF
+    
+    while True:
+        occupied = a | h
+        while i < 9 and (occupied >> MOVE_ORDER[i]) & 1:
+            i += 1
+        
+        if i == 9:
+            # Sin hijos pendientes (o podado): el score sube al marco padre
+            score = best
+            if not stack:
+                return score
+            a, h, is_max, alpha, beta, i, best = stack.pop()
+            depth -= 1
+        else:
+            move = MOVE_ORDER[i]
+            i += 1
+            if is_max:
+                child_a, child_h = a | (1 << move), h
+            else:
+                child_a, child_h = a, h | (1 << move)
+            
+            if WIN_ARRAY[child_a]:
+                score = 10 - depth - 1
+            elif WIN_ARRAY[child_h]:
+                score = depth + 1 - 10
+            elif (child_a | child_h) == FULL_BOARD:
+                score = 0
+            else:
+                stack.append((a, h, is_max, alpha, beta, i, best))
+                a = child_a
+                h = child_h
+                is_max = not is_max
+                i = 0
+                best = -SCORE_INF if is_max else SCORE_INF
+                depth += 1
+                continue
+        
+        if is_max:
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+        else:
+            if score < best:
+                best = score
+            if best < beta:
+                beta = best
+        if beta <= alpha:
+            i = 9
+
+def best_move(x, o, ai_player, hu_player):
     """Encuentra el mejor movimiento para la IA e imprime el árbol de búsqueda"""
+    if LUT is not None:
+        move = LUT[board_str(x, o) + ai_player]
+        print(f"\nIA consultó la tabla precalculada: posición {move+1}\n")
+        return move
+    
+    TT.clear()
     
     # Optimización: Si el tablero está vacío, jugar en el centro (posición 4)
     # Esto evita calcular 362,880 estados en el primer movimiento
-    if board.count(' ') == 9:
+    if (x | o) == 0:
         print("\n" + "="*60)
         print("PRIMER MOVIMIENTO - HEURÍSTICA")
         print("="*60)
@@ -160,32 +348,42 @@ def best_move(board, ai_player, hu_player):
     
     # Si quedan muy pocas casillas, imprimir el árbol completo para fines educativos
     # Caso contrario, solo imprimir la decisión final para evitar spam en consola
-    should_print = board.count(' ') <= 5  # Solo imprimir árbol cuando quedan 5 o menos casillas
+    should_print = PRINT_TREE and 9 - (x | o).bit_count() <= 5  # Solo imprimir árbol cuando quedan 5 o menos casillas
     
     if should_print:
         print("\n" + "="*60)
         print("ÁRBOL DE BÚSQUEDA MINIMAX CON PODA ALPHA-BETA")
         print("="*60)
     
-    best_score = -math.inf
+    best_score = -SCORE_INF
     move_choice = None
-    moves = available_moves(board)
-    alpha = -math.inf
-    beta = math.inf
+    ai_bits, hu_bits = (x, o) if ai_player == 'X' else (o, x)
+    
+    # Movimientos que llevan a tableros simétricos valen lo mismo: se evalúa
+    # solo el primero de cada clase (el que se habría elegido en un empate)
+    moves = []
+    seen = set()
+    for move in available_moves(x, o):
+        key = canonical(ai_bits | (1 << move), hu_bits)
+        if key not in seen:
+            seen.add(key)
+            moves.append(move)
     
     if should_print:
         print(f"Evaluando {len(moves)} movimientos posibles desde el estado actual:")
-        print_board_state(board, 0, "")
+        print_board_state(x, o, 0, "")
         print()
     else:
         print(f"\nIA pensando... (evaluando {len(moves)} movimientos con poda Alpha-Beta)")
     
     for move in moves:
-        board[move] = ai_player
         if should_print:
             print(f"\n┌─ Evaluando movimiento en posición {move+1} (IA juega {ai_player}):")
-        score = minimax(board, 0, False, ai_player, hu_player, alpha, beta, print_tree=should_print)
-        board[move] = ' '
+        # La ventana se estrecha con el mejor score encontrado entre los hermanos
+        if should_print:
+            score = _minimax_verbose(ai_bits | (1 << move), hu_bits, 0, False, ai_player, hu_player, best_score, SCORE_INF)
+        else:
+            score = _minimax_fast(ai_bits | (1 << move), hu_bits, 0, False, best_score, SCORE_INF)
         
         if should_print:
             print(f"└─ Score final para movimiento {move+1}: {score}")
@@ -193,8 +391,6 @@ def best_move(board, ai_player, hu_player):
         if score > best_score:
             best_score = score
             move_choice = move
-        
-        alpha = max(alpha, best_score)
     
     if should_print:
         print(f"\n{'='*60}")
@@ -215,134 +411,135 @@ class TicTacToeGame:
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 36)
         
+        # Textos estáticos: se renderizan una sola vez y en cada frame solo se copian
+        self.title_surf = self.font_large.render('GATO - MINIMAX', True, TEXT_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(WINDOW_SIZE//2, 100))
+        self.subtitle_surf = self.font_small.render('Elige tu símbolo:', True, TEXT_COLOR)
+        self.subtitle_rect = self.subtitle_surf.get_rect(center=(WINDOW_SIZE//2, 200))
+        self.x_text = self.font_large.render('X', True, TEXT_COLOR)
+        self.x_text_rect = self.x_text.get_rect(center=BUTTONS['x'].center)
+        self.o_text = self.font_large.render('O', True, TEXT_COLOR)
+        self.o_text_rect = self.o_text.get_rect(center=BUTTONS['o'].center)
+        self.note_surf = self.font_small.render('(X juega primero)', True, TEXT_COLOR)
+        self.note_rect = self.note_surf.get_rect(center=(WINDOW_SIZE//2, 450))
+        self.button_text = self.font_medium.render('Nueva Partida', True, TEXT_COLOR)
+        self.button_text_rect = self.button_text.get_rect(center=BUTTONS['new_game'].center)
+        self.winner_texts = {}
+        for winner, msg in (('Tie', '¡EMPATE!'), ('X', '¡Gana X!'), ('O', '¡Gana O!')):
+            text = self.font_large.render(msg, True, TEXT_COLOR)
+            self.winner_texts[winner] = (text, text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 - 50)))
+        
+        # Semi-transparente overlay de game over
+        self.overlay = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
+        self.overlay.set_alpha(200)
+        self.overlay.fill(BG_COLOR)
+        
+        # Fondo del tablero con las líneas ya dibujadas (la cuadrícula nunca cambia)
+        self.board_bg = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE)).convert()
+        self.board_bg.fill(BG_COLOR)
+        # Líneas horizontales
+        pygame.draw.line(self.board_bg, LINE_COLOR, (0, CELL_SIZE), 
+                        (WINDOW_SIZE, CELL_SIZE), LINE_WIDTH)
+        pygame.draw.line(self.board_bg, LINE_COLOR, (0, 2 * CELL_SIZE), 
+                        (WINDOW_SIZE, 2 * CELL_SIZE), LINE_WIDTH)
+        # Líneas verticales
+        pygame.draw.line(self.board_bg, LINE_COLOR, (CELL_SIZE, 0), 
+                        (CELL_SIZE, WINDOW_SIZE), LINE_WIDTH)
+        pygame.draw.line(self.board_bg, LINE_COLOR, (2 * CELL_SIZE, 0), 
+                        (2 * CELL_SIZE, WINDOW_SIZE), LINE_WIDTH)
+        
+        # Figuras X y O prerenderizadas del tamaño de una casilla, con fondo transparente
+        self.x_surf = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+        pygame.draw.line(self.x_surf, CROSS_COLOR, (SPACE, SPACE), 
+                        (CELL_SIZE - SPACE, CELL_SIZE - SPACE), CROSS_WIDTH)
+        pygame.draw.line(self.x_surf, CROSS_COLOR, (SPACE, CELL_SIZE - SPACE), 
+                        (CELL_SIZE - SPACE, SPACE), CROSS_WIDTH)
+        self.x_surf = self.x_surf.convert_alpha()
+        self.o_surf = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(self.o_surf, CIRCLE_COLOR, (CELL_SIZE // 2, CELL_SIZE // 2), 
+                          CIRCLE_RADIUS, CIRCLE_WIDTH)
+        self.o_surf = self.o_surf.convert_alpha()
+        
         self.state = 'menu'  # 'menu', 'playing', 'game_over'
-        self.board = [' '] * 9
+        self.x = 0  # Bitboard de X
+        self.o = 0  # Bitboard de O
         self.hu_player = None
         self.ai_player = None
         self.hu_turn = False
         self.winner = None
-        self.button_rect = None
+        self.dirty = True  # Hay que redibujar la pantalla en el próximo frame
+        
+        # Sin árbol que imprimir, la IA responde con la tabla precalculada
+        if not PRINT_TREE:
+            load_lut()
     
     def draw_menu(self):
         """Dibuja el menú de inicio"""
         self.screen.fill(BG_COLOR)
         
         # Título
-        title = self.font_large.render('GATO - MINIMAX', True, TEXT_COLOR)
-        title_rect = title.get_rect(center=(WINDOW_SIZE//2, 100))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(self.title_surf, self.title_rect)
         
         # Subtítulo
-        subtitle = self.font_small.render('Elige tu símbolo:', True, TEXT_COLOR)
-        subtitle_rect = subtitle.get_rect(center=(WINDOW_SIZE//2, 200))
-        self.screen.blit(subtitle, subtitle_rect)
+        self.screen.blit(self.subtitle_surf, self.subtitle_rect)
         
         # Botones X y O
         mouse_pos = pygame.mouse.get_pos()
         
         # Botón X
-        x_button = pygame.Rect(150, 280, 120, 120)
+        x_button = BUTTONS['x']
         x_color = BUTTON_HOVER if x_button.collidepoint(mouse_pos) else BUTTON_COLOR
         pygame.draw.rect(self.screen, x_color, x_button, border_radius=10)
-        x_text = self.font_large.render('X', True, TEXT_COLOR)
-        x_text_rect = x_text.get_rect(center=x_button.center)
-        self.screen.blit(x_text, x_text_rect)
+        self.screen.blit(self.x_text, self.x_text_rect)
         
         # Botón O
-        o_button = pygame.Rect(330, 280, 120, 120)
+        o_button = BUTTONS['o']
         o_color = BUTTON_HOVER if o_button.collidepoint(mouse_pos) else BUTTON_COLOR
         pygame.draw.rect(self.screen, o_color, o_button, border_radius=10)
-        o_text = self.font_large.render('O', True, TEXT_COLOR)
-        o_text_rect = o_text.get_rect(center=o_button.center)
-        self.screen.blit(o_text, o_text_rect)
+        self.screen.blit(self.o_text, self.o_text_rect)
         
         # Nota
-        note = self.font_small.render('(X juega primero)', True, TEXT_COLOR)
-        note_rect = note.get_rect(center=(WINDOW_SIZE//2, 450))
-        self.screen.blit(note, note_rect)
+        self.screen.blit(self.note_surf, self.note_rect)
         
         return x_button, o_button
     
     def draw_lines(self):
-        """Dibuja las líneas del tablero"""
-        # Líneas horizontales
-        pygame.draw.line(self.screen, LINE_COLOR, (0, CELL_SIZE), 
-                        (WINDOW_SIZE, CELL_SIZE), LINE_WIDTH)
-        pygame.draw.line(self.screen, LINE_COLOR, (0, 2 * CELL_SIZE), 
-                        (WINDOW_SIZE, 2 * CELL_SIZE), LINE_WIDTH)
-        
-        # Líneas verticales
-        pygame.draw.line(self.screen, LINE_COLOR, (CELL_SIZE, 0), 
-                        (CELL_SIZE, WINDOW_SIZE), LINE_WIDTH)
-        pygame.draw.line(self.screen, LINE_COLOR, (2 * CELL_SIZE, 0), 
-                        (2 * CELL_SIZE, WINDOW_SIZE), LINE_WIDTH)
+        """Dibuja el fondo y las líneas del tablero"""
+        self.screen.blit(self.board_bg, (0, 0))
     
     def draw_figures(self):
         """Dibuja X y O en el tablero"""
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                idx = row * GRID_SIZE + col
-                if self.board[idx] == 'O':
-                    center = (col * CELL_SIZE + CELL_SIZE // 2, 
-                             row * CELL_SIZE + CELL_SIZE // 2)
-                    pygame.draw.circle(self.screen, CIRCLE_COLOR, center, 
-                                     CIRCLE_RADIUS, CIRCLE_WIDTH)
-                elif self.board[idx] == 'X':
-                    start_desc = (col * CELL_SIZE + SPACE, 
-                                 row * CELL_SIZE + SPACE)
-                    end_desc = (col * CELL_SIZE + CELL_SIZE - SPACE, 
-                               row * CELL_SIZE + CELL_SIZE - SPACE)
-                    pygame.draw.line(self.screen, CROSS_COLOR, start_desc, 
-                                   end_desc, CROSS_WIDTH)
-                    
-                    start_asc = (col * CELL_SIZE + SPACE, 
-                                row * CELL_SIZE + CELL_SIZE - SPACE)
-                    end_asc = (col * CELL_SIZE + CELL_SIZE - SPACE, 
-                              row * CELL_SIZE + SPACE)
-                    pygame.draw.line(self.screen, CROSS_COLOR, start_asc, 
-                                   end_asc, CROSS_WIDTH)
+        for idx, pos in enumerate(CELL_POSITIONS):
+            if (self.o >> idx) & 1:
+                self.screen.blit(self.o_surf, pos)
+            elif (self.x >> idx) & 1:
+                self.screen.blit(self.x_surf, pos)
     
     def draw_game_over(self):
         """Dibuja la pantalla de game over"""
         # Semi-transparente overlay
-        overlay = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
-        overlay.set_alpha(200)
-        overlay.fill(BG_COLOR)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
         
         # Mensaje de ganador
-        if self.winner == 'Tie':
-            msg = '¡EMPATE!'
-        else:
-            msg = f'¡Gana {self.winner}!'
-        
-        text = self.font_large.render(msg, True, TEXT_COLOR)
-        text_rect = text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 - 50))
+        text, text_rect = self.winner_texts[self.winner]
         self.screen.blit(text, text_rect)
         
         # Botón de nueva partida
         mouse_pos = pygame.mouse.get_pos()
-        button = pygame.Rect(150, 400, 300, 60)
+        button = BUTTONS['new_game']
         button_color = BUTTON_HOVER if button.collidepoint(mouse_pos) else BUTTON_COLOR
         pygame.draw.rect(self.screen, button_color, button, border_radius=10)
         
-        button_text = self.font_medium.render('Nueva Partida', True, TEXT_COLOR)
-        button_text_rect = button_text.get_rect(center=button.center)
-        self.screen.blit(button_text, button_text_rect)
-        
-        self.button_rect = button
+        self.screen.blit(self.button_text, self.button_text_rect)
     
     def handle_click_menu(self, pos):
         """Maneja clicks en el menú"""
-        x_button = pygame.Rect(150, 280, 120, 120)
-        o_button = pygame.Rect(330, 280, 120, 120)
-        
-        if x_button.collidepoint(pos):
+        if BUTTONS['x'].collidepoint(pos):
             self.hu_player = 'X'
             self.ai_player = 'O'
             self.hu_turn = True  # X empieza
             self.start_game()
-        elif o_button.collidepoint(pos):
+        elif BUTTONS['o'].collidepoint(pos):
             self.hu_player = 'O'
             self.ai_player = 'X'
             self.hu_turn = False  # IA (X) empieza
@@ -350,7 +547,8 @@ class TicTacToeGame:
     
     def start_game(self):
         """Inicia una nueva partida"""
-        self.board = [' '] * 9
+        self.x = 0
+        self.o = 0
         self.state = 'playing'
         self.winner = None
         print(f"\n{'='*60}")
@@ -370,11 +568,11 @@ class TicTacToeGame:
         row = pos[1] // CELL_SIZE
         idx = row * GRID_SIZE + col
         
-        if self.board[idx] == ' ':
-            self.board[idx] = self.hu_player
+        if not ((self.x | self.o) >> idx) & 1:
+            self.x, self.o = place(self.x, self.o, idx, self.hu_player)
             print(f"\nJugador humano ({self.hu_player}) juega en posición {idx+1}")
             
-            winner = check_winner(self.board)
+            winner = check_winner(self.x, self.o)
             if winner:
                 self.winner = winner
                 self.state = 'game_over'
@@ -385,13 +583,13 @@ class TicTacToeGame:
     
     def ai_move(self):
         """La IA hace su movimiento"""
-        if available_moves(self.board):
-            move = best_move(self.board, self.ai_player, self.hu_player)
+        if available_moves(self.x, self.o):
+            move = best_move(self.x, self.o, self.ai_player, self.hu_player)
             if move is not None:
-                self.board[move] = self.ai_player
+                self.x, self.o = place(self.x, self.o, move, self.ai_player)
                 print(f"\nIA ({self.ai_player}) juega en posición {move+1}")
                 
-                winner = check_winner(self.board)
+                winner = check_winner(self.x, self.o)
                 if winner:
                     self.winner = winner
                     self.state = 'game_over'
@@ -400,18 +598,33 @@ class TicTacToeGame:
     
     def handle_click_game_over(self, pos):
         """Maneja clicks en la pantalla de game over"""
-        if self.button_rect and self.button_rect.collidepoint(pos):
+        if BUTTONS['new_game'].collidepoint(pos):
             self.state = 'menu'
     
     def run(self):
         """Loop principal del juego"""
         running = True
         while running:
-            for event in pygame.event.get():
+            if self.dirty:
+                events = pygame.event.get()
+            else:
+                # Nada cambió en pantalla: se duerme hasta el siguiente evento
+                events = [pygame.event.wait()] + pygame.event.get()
+            
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 
+                elif event.type == pygame.MOUSEMOTION:
+                    # Solo el menú y el game over tienen efectos hover
+                    if self.state != 'playing':
+                        self.dirty = True
+                
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self.dirty = True
+                
                 elif event.type == pygame.MOUSEBUTTONDOWN:
+                    self.dirty = True  # Jugadas y cambios de estado llegan por clicks
                     if self.state == 'menu':
                         self.handle_click_menu(event.pos)
                     elif self.state == 'playing':
@@ -424,12 +637,15 @@ class TicTacToeGame:
                     pygame.time.set_timer(pygame.USEREVENT, 0)  # Desactiva timer
                     if self.state == 'playing' and not self.hu_turn:
                         self.ai_move()
+                        self.dirty = True
+            
+            if not self.dirty:
+                continue
             
             # Dibujar
             if self.state == 'menu':
                 self.draw_menu()
             elif self.state == 'playing' or self.state == 'game_over':
-                self.screen.fill(BG_COLOR)
                 self.draw_lines()
                 self.draw_figures()
                 
@@ -437,7 +653,9 @@ class TicTacToeGame:
                     self.draw_game_over()
             
             pygame.display.flip()
-            self.clock.tick(60)
+            self.dirty = False
+            # Los redibujados por hover no necesitan más de 30 fps
+            self.clock.tick(60 if self.state == 'playing' else 30)
         
         pygame.quit()
         sys.exit()
@@ -0,0 +1,47 @@
+"""
+Precalcula el mejor movimiento de la IA para todos los estados alcanzables del Gato
+
+Recorre todos los tableros no terminales que pueden aparecer en una partida,
+ejecuta la búsqueda Minimax una sola vez por estado y guarda el resultado en
+minimax.json con el formato {tablero + jugador en turno: posición}.
+
+Uso:
+    python precompute.py
+"""
+
+import contextlib
+import json
+import os
+
+import minimaxgato
+from minimaxgato import (LUT_PATH, available_moves, best_move, board_str,
+                         check_winner, place)
+
+def reachable_states(x, o, turn, states):
+    """Agrega a states todos los tableros no terminales alcanzables desde (x, o)"""
+    key = board_str(x, o) + turn
+    if key in states or check_winner(x, o):
+        return
+    states[key] = (x, o)
+    other = 'O' if turn == 'X' else 'X'
+    for move in available_moves(x, o):
+        reachable_states(*place(x, o, move, turn), other, states)
+
+def main():
+    minimaxgato.LUT = None  # Asegura que se use la búsqueda y no una tabla previa
+    states = {}
+    reachable_states(0, 0, 'X', states)
+    
+    # La búsqueda imprime su progreso; aquí solo interesa el resultado
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for key, (x, o) in states.items():
+            ai_player = key[9]
+            hu_player = 'O' if ai_player == 'X' else 'X'
+            states[key] = best_move(x, o, ai_player, hu_player)
+    
+    with open(LUT_PATH, 'w', encoding='utf-8') as f:
+        json.dump(states, f, separators=(',', ':'))
+    print(f"{len(states)} estados guardados en {LUT_PATH}")
+
+if __name__ == '__main__':
+    main()